@@ -15,6 +15,7 @@ Also handles port management, allowing users to find and kill processes using sp
 import subprocess
 import os
 import signal
+import socket
 import atexit
 import time
 
@@ -117,6 +118,30 @@ class BackgroundProcessManager:
             print(f"BackgroundProcessManager: Error starting process '{name}' with command '{command}': {e}")
         return None
 
+    @staticmethod
+    def _terminate_process_group(
+            process: subprocess.Popen, pgid: int, timeout: float = 5) -> bool:
+        """
+        Terminates the process group of a POSIX process, escalating to SIGKILL
+        if it does not exit within the timeout.
+
+        Args:
+            process: The process leading the group to terminate.
+            pgid: The process group ID of the process.
+            timeout: Seconds to wait for a graceful exit after SIGTERM.
+
+        Returns:
+            True if the group exited after SIGTERM, False if it had to be killed.
+        """
+        os.killpg(pgid, signal.SIGTERM) # Send SIGTERM to the entire process group
+        try:
+            process.wait(timeout=timeout) # Wait for the main process
+            return True
+        except subprocess.TimeoutExpired:
+            os.killpg(pgid, signal.SIGKILL) # Force kill
+            process.wait()
+            return False
+
     def kill_process(self, name: str, verbose: bool = True) -> None:
         """
         Kills a managed background process by its name.
@@ -145,17 +170,11 @@ class BackgroundProcessManager:
                     )
                 else: # POSIX
                     pgid = os.getpgid(process.pid)
-                    os.killpg(pgid, signal.SIGTERM) # Send SIGTERM to the entire process group
-                    try:
-                        process.wait(timeout=5) # Wait for the main process
+                    if self._terminate_process_group(process, pgid):
                         if verbose:
                             print(f"BackgroundProcessManager: Process group for '{name}' (PGID: {pgid}) terminated gracefully (SIGTERM).")
-                    except subprocess.TimeoutExpired:
-                        if verbose:
-                            print(f"BackgroundProcessManager: '{name}' (PGID: {pgid}) did not terminate with SIGTERM after 5s. Sending SIGKILL.")
-                        os.killpg(pgid, signal.SIGKILL) # Force kill
-                        if verbose:
-                            print(f"BackgroundProcessManager: Process group for '{name}' (PGID: {pgid}) killed (SIGKILL).")
+                    elif verbose:
+                        print(f"BackgroundProcessManager: '{name}' (PGID: {pgid}) did not terminate with SIGTERM after 5s. Killed with SIGKILL.")
                 if verbose:
                     print(f"BackgroundProcessManager: Successfully initiated termination for '{name}'.")
             except ProcessLookupError: # Process already died
@@ -189,35 +208,14 @@ class BackgroundProcessManager:
         else:
             print("BackgroundProcessManager: Script exiting. Cleaning up all registered background processes...")
 
-        # Create a list of names to avoid issues with modifying dict during iteration
+        # Create a list of names to avoid issues with modifying dict during iteration.
+        # The singleton is created at import time, so cls() returns the existing instance.
+        manager = cls._instance or cls()
         for name in list(cls._processes.keys()):
-            # Need an instance to call the instance method kill_process
-            # However, since kill_process modifies cls._processes, we can adapt its logic here
-            # or ensure we have an instance. The singleton pattern means _instance should be set.
-            if cls._instance:
-                cls._instance.kill_process(name, verbose=False) # Less verbose during atexit
-            else:
-                # Fallback if no instance was explicitly created but atexit is called (should not happen with __new__)
-                # This is a simplified version for direct cleanup if _instance is somehow None
-                process_obj = cls._processes.get(name)
-                if process_obj and process_obj.poll() is None:
-                    print(f"BackgroundProcessManager (atexit): Terminating '{name}' (PID: {process_obj.pid})...")
-                    try:
-                        if os.name == 'nt':
-                            subprocess.check_call(['taskkill', '/F', '/T', '/PID', str(process_obj.pid)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        else:
-                            pgid = os.getpgid(process_obj.pid)
-                            os.killpg(pgid, signal.SIGTERM)
-                            time.sleep(0.2) # Brief pause for SIGTERM
-                            try: # Check if still alive
-                                os.killpg(pgid, 0) # Raises ProcessLookupError if dead
-                                os.killpg(pgid, signal.SIGKILL)
-                            except ProcessLookupError:
-                                pass # Gracefully terminated
-                            except Exception:
-                                pass # Error sending SIGKILL, not much more to do
-                    except Exception as e_atexit:
-                        print(f"BackgroundProcessManager (atexit): Error terminating '{name}': {e_atexit}")
+            try:
+                manager.kill_process(name, verbose=False) # Less verbose during atexit
+            except Exception as e_atexit:
+                print(f"BackgroundProcessManager (atexit): Error terminating '{name}': {e_atexit}")
         cls._processes.clear()
         if cls._is_running_in_jupyter():
             print("BackgroundProcessManager: Automated cleanup complete.")
@@ -361,6 +359,40 @@ class BackgroundProcessManager:
         
         return killed_any
 
+    def wait_for_port(self, port: int, host: str = "localhost", timeout: float = 30.0, verbose: bool = True) -> bool:
+        """
+        Wait until a server accepts TCP connections on a port.
+
+        Each probe is a plain TCP connect, which is enough to tell that the server
+        is listening without opening a full client session against it. Probes back
+        off exponentially from 20ms to 0.5s, so a fast server is detected quickly.
+
+        Args:
+            port: The port number to probe.
+            host: The host the server listens on.
+            timeout: Maximum number of seconds to wait.
+            verbose: Whether to print detailed messages.
+
+        Returns:
+            True if the port accepted a connection before the timeout, False otherwise.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.02
+        while True:
+            try:
+                with socket.create_connection((host, port), timeout=0.3):
+                    if verbose:
+                        print(f"BackgroundProcessManager: Server on {host}:{port} is ready.")
+                    return True
+            except OSError:
+                pass
+            if time.monotonic() >= deadline:
+                if verbose:
+                    print(f"BackgroundProcessManager: Server on {host}:{port} not ready after {timeout}s.")
+                return False
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 1.6, 0.5)
+
     def clear_port(self, port: int, verbose: bool = True) -> bool:
         """
         Convenience method to clear a port by killing any processes using it.
@@ -414,6 +446,10 @@ def clear_port(port: int, verbose: bool = True) -> bool:
     """Convenience function to clear a port by killing any processes using it."""
     return _process_manager_singleton.clear_port(port, verbose)
 
+def wait_for_port(port: int, host: str = "localhost", timeout: float = 30.0, verbose: bool = True) -> bool:
+    """Convenience function to wait until a server accepts connections on a port."""
+    return _process_manager_singleton.wait_for_port(port, host, timeout, verbose)
+
 def find_processes_by_port(port: int) -> list[tuple[int, str]]:
     """Convenience function to find processes using a specific port."""
     return _process_manager_singleton.find_processes_by_port(port)
@@ -12,6 +12,7 @@ response printing, and orchestrates calls to list and use
 MCP tools, resources, and prompts.
 """
 
+import asyncio
 import json
 import pprint
 from typing import Any, List
@@ -52,28 +53,26 @@ def print_response(name: str, response: Any, extra_info: dict = None) -> None:
         pprint.pprint(extra_info)
     print(f"--- End of {name} ---")
 
-def mcp_messages_to_langchain(mcp_messages: List[Any]) -> List[Any]:
-    """Convert MCP prompt messages to LangChain message format."""
-    langchain_messages = []
-
-    for msg in mcp_messages:
-        # Extract the text content
-        if hasattr(msg.content, 'text'):
-            text = msg.content.text
-        elif isinstance(msg.content, str):
-            text = msg.content
-        else:
-            text = str(msg.content)
+_ROLE_TO_LANGCHAIN = {
+    'system': SystemMessage,
+    'user': HumanMessage,
+    'assistant': AIMessage,
+}
 
-        # Convert based on role
-        if msg.role == 'system':
-            langchain_messages.append(SystemMessage(content=text))
-        elif msg.role == 'user':
-            langchain_messages.append(HumanMessage(content=text))
-        elif msg.role == 'assistant':
-            langchain_messages.append(AIMessage(content=text))
+def _extract_text(content: Any) -> str:
+    """Return the text of an MCP message content item."""
+    if isinstance(content, str):
+        return content
+    text = getattr(content, 'text', None)
+    return str(content) if text is None else text
 
-    return langchain_messages
+def mcp_messages_to_langchain(mcp_messages: List[Any]) -> List[Any]:
+    """Convert MCP prompt messages to LangChain message format."""
+    return [
+        _ROLE_TO_LANGCHAIN[msg.role](content=_extract_text(msg.content))
+        for msg in mcp_messages
+        if msg.role in _ROLE_TO_LANGCHAIN
+    ]
 
 async def demonstrate_tool_usage(session: ClientSession, tools: List[Any]):
     """Demonstrates various tool calls with explanations."""
@@ -250,9 +249,11 @@ async def run_demo(session: ClientSession):
 
     # Discover available capabilities
     print_step("Discovery", "Finding what the server offers")
-    tools = await session.list_tools()
-    resources = await session.list_resources()
-    prompts = await session.list_prompts()
+    tools, resources, prompts = await asyncio.gather(
+        session.list_tools(),
+        session.list_resources(),
+        session.list_prompts(),
+    )
 
     print(f"🔧 Found {len(tools.tools)} tools: {[t.name for t in tools.tools]}")
     print(f"📄 Found {len(resources.resources)} resources: {[r.uri for r in resources.resources]}")
@@ -12,16 +12,19 @@ with the server's tools, resources, and prompts.
 """
 
 import asyncio
+import os
+import sys
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from notebooks.platform_services.lablib.mcp.client_util import run_demo
 
 async def main():
-    import os
     file_dir = os.path.dirname(__file__)
+    # Launch the server with the interpreter already running this client,
+    # which has the MCP SDK installed, instead of resolving a new `uv run`
     server_params = StdioServerParameters(
-        command="uv",
-        args=["run", os.path.join(file_dir, "server.py")]
+        command=sys.executable,
+        args=[os.path.join(file_dir, "server.py")]
     )
 
     async with stdio_client(server_params) as (reader, writer):
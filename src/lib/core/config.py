@@ -12,7 +12,10 @@ ensures that these settings are easily accessible throughout an application.
 
 import os
 from os.path import join, dirname
+import copy
 import inspect
+import threading
+from collections import OrderedDict
 from dotenv import load_dotenv
 import yaml
 from src.lib.core.template_engine import TemplateEngine
@@ -29,6 +32,11 @@ class Config:
     A class used to represent and manage configuration settings for an application.
     """
 
+    # Parsed YAML shared across instances, keyed by (path, mtime, size)
+    _yaml_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _YAML_CACHE_SIZE = 100
+    _yaml_cache_lock = threading.Lock()
+
     def __init__(
             self,
             config_file: str = "",
@@ -56,10 +64,8 @@ class Config:
         :return: Dictionary containing configuration settings.
         """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as file:
-                raw_content = file.read()
-                file_data = yaml.safe_load(raw_content)
-                self.prompts = file_data.get("prompts", {})
+            raw_content, file_data = self._read_yaml_file(self.config_file)
+            self.prompts = file_data.get("prompts", {})
             settings = self._replace_placeholders_in_data(file_data)
             if settings:
                 settings["_file_path"] = self.config_file
@@ -74,6 +80,36 @@ class Config:
             logger.error("An unexpected error occurred: %s", e)
         return {}
 
+    @classmethod
+    def _read_yaml_file(cls, path: str) -> tuple:
+        """
+        Read and parse a YAML file, reusing the previous parse while the file is unchanged.
+
+        :param path: Path to the YAML file.
+        :return: Tuple of the raw file content and a private copy of the parsed data.
+        """
+        try:
+            stat = os.stat(path)
+            key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None  # Let open() report the error
+        with cls._yaml_cache_lock:
+            cached = cls._yaml_cache.get(key)
+            if cached is not None:
+                cls._yaml_cache.move_to_end(key)
+        if cached is not None:
+            raw_content, file_data = cached
+            return raw_content, copy.deepcopy(file_data)
+        with open(path, 'r', encoding='utf-8') as file:
+            raw_content = file.read()
+        file_data = yaml.safe_load(raw_content)
+        if key is not None:
+            with cls._yaml_cache_lock:
+                cls._yaml_cache[key] = (raw_content, file_data)
+                if len(cls._yaml_cache) > cls._YAML_CACHE_SIZE:
+                    cls._yaml_cache.popitem(last=False)
+        return raw_content, copy.deepcopy(file_data)
+
     def _replace_placeholders_in_data(self, data: any) -> any:
         """
         Recursively replace placeholders with environment variable values in a nested structure.
@@ -23,6 +23,25 @@ from src.lib.services.chat.message_managers.message import (
 
 logger = Logger().get_logger()
 
+_ROLE_TO_LC_TYPE = {
+    MessageRole.USER: HumanMessage,
+    MessageRole.ASSISTANT: AIMessage,
+    MessageRole.SYSTEM: SystemMessage,
+}
+_LC_TYPE_TO_ROLE = {lc_type: role for role, lc_type in _ROLE_TO_LC_TYPE.items()}
+
+
+def _lc_message_role(msg: Any) -> MessageRole:
+    """
+    Map a LangChain message to its role, resolving subclasses through the MRO
+    and falling back to USER for unknown types.
+    """
+    for cls in type(msg).__mro__:
+        role = _LC_TYPE_TO_ROLE.get(cls)
+        if role is not None:
+            return role
+    return MessageRole.USER
+
 
 class LangChainChatMessageManager(BaseMessageManager):
     """
@@ -58,19 +77,15 @@ class LangChainChatMessageManager(BaseMessageManager):
         :param messages: List of internal ChatMessage objects.
         :return: List of LangChain message objects.
         """
-        result = []
+        lc_messages = []
         for msg in messages:
             if not isinstance(msg, ChatMessage):
                 logger.warning(f"Skipped not valid message: {msg}")
-                continue  # skip invalid types
-            text = msg.to_text()
-            if msg.role == MessageRole.USER:
-                result.append(HumanMessage(content=text))
-            elif msg.role == MessageRole.ASSISTANT:
-                result.append(AIMessage(content=text))
-            elif msg.role == MessageRole.SYSTEM:
-                result.append(SystemMessage(content=text))
-        return result
+                continue
+            lc_type = _ROLE_TO_LC_TYPE.get(msg.role)
+            if lc_type is not None:
+                lc_messages.append(lc_type(content=msg.to_text()))
+        return lc_messages
 
     def from_framework_messages(self, messages: List[Any]) -> List[ChatMessage]:
         """
@@ -79,13 +94,7 @@ class LangChainChatMessageManager(BaseMessageManager):
         :param messages: List of LangChain message objects.
         :return: List of internal ChatMessage objects.
         """
-        converted = []
-        for msg in messages:
-            role = (
-                MessageRole.USER if isinstance(msg, HumanMessage) else
-                MessageRole.ASSISTANT if isinstance(msg, AIMessage) else
-                MessageRole.SYSTEM if isinstance(msg, SystemMessage) else
-                MessageRole.USER  # fallback
-            )
-            converted.append(ChatMessage(role=role, blocks=[TextBlock(text=msg.content)]))
-        return converted
+        return [
+            ChatMessage(role=_lc_message_role(msg), blocks=[TextBlock(text=msg.content)])
+            for msg in messages
+        ]
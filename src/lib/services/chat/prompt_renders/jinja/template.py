@@ -25,6 +25,10 @@ class JinjaTemplatePromptRender(BasePromptRender):
     Prompt Render class to manage prompts.
     """
 
+    # Jinja environments shared by all instances, keyed by environment path,
+    # so templates loaded from the same folder are compiled only once
+    _environments: Dict[str, Environment] = {}
+
     class Config(BasePromptRender.Config):
         """
         Configuration for the Prompt Render class.
@@ -75,13 +79,28 @@ class JinjaTemplatePromptRender(BasePromptRender):
         """
         env_path = self.config.environment
         file_path = self.config.templates[prompt_name]
-        environment = Environment(loader=FileSystemLoader(env_path))
+        environment = self._get_environment(env_path)
         template = environment.get_template(file_path)
         self.result.status = "success"
         self.result.content = template.render(params)
         logger.debug(f"Prompt generated from {env_path}/{file_path} with params {params}")
         return self.result
 
+    @classmethod
+    def _get_environment(cls, env_path: str) -> Environment:
+        """
+        Return the Jinja environment of a template folder, creating it on first use.
+        Templates are reloaded when their file changes on disk or is rewritten by save.
+
+        :param env_path: Path to the template folder.
+        :return: Jinja environment loading templates from that folder.
+        """
+        environment = cls._environments.get(env_path)
+        if environment is None:
+            environment = Environment(loader=FileSystemLoader(env_path))
+            cls._environments[env_path] = environment
+        return environment
+
     @prompt_error_handler("An error occurred while saving the template")
     def save(self, prompt_name: str, content: str) -> JinjaTemplatePromptRender.Result:
         """
@@ -94,6 +113,8 @@ class JinjaTemplatePromptRender(BasePromptRender):
         output_file = f"{self.config.environment}/{self.config.templates[prompt_name]}"
         with open(output_file, 'w', encoding='utf-8') as file:
             file.write(content)
+        # Drop the compiled templates of this folder, so the next load reads the new content
+        self._environments.pop(self.config.environment, None)
         self.result.status = "success"
         logger.info(f"Prompt content saved to: {output_file}")
         return self.result
@@ -103,9 +103,6 @@ def test_warn_on_extra_fields(caplog):
         messages=[{"role": "user", "content": "Hi"}],
         unexpected_field="test"
     )
-    # Print captured logs (optional debug)
-    for r in caplog.records:
-        print(f"LOG: {r.name} - {r.message}")
     assert any("Unexpected field in request: unexpected_field" in r.message for r in caplog.records)
 
 
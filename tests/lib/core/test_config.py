@@ -7,6 +7,7 @@ configuration settings from a YAML file.
 """
 
 import os
+from collections import OrderedDict
 from unittest.mock import mock_open, patch
 import yaml
 import pytest
@@ -19,8 +20,14 @@ database:
   host: $ENV{DB_HOST}
   port: 5432
 """
-# Mocked environment variables
-os.environ['DB_HOST'] = 'localhost'
+
+
+@pytest.fixture(autouse=True)
+def db_host_env(monkeypatch):
+    """
+    Mocked environment variables, restored after each test
+    """
+    monkeypatch.setenv('DB_HOST', 'localhost')
 
 
 def test_load_yaml_success():
@@ -117,6 +124,26 @@ def test_load_yaml_preserves_raw_text():
             assert config.settings["_raw_file"] == raw_data
 
 
+def test_load_yaml_reuses_parse_until_file_changes(tmp_path, monkeypatch):
+    """
+    Test that loading an unchanged file twice parses it once, and that
+    a modified file is parsed again.
+    """
+    monkeypatch.setattr(Config, "_yaml_cache", OrderedDict())
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(YAML_CONTENT_PLACEHOLDERS, encoding="utf-8")
+    with patch("yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+        first = Config(str(config_file))
+        first.settings['database']['port'] = 1234
+        second = Config(str(config_file))
+        assert mock_load.call_count == 1
+        assert second.settings['database']['port'] == 5432
+        config_file.write_text(YAML_CONTENT_PLACEHOLDERS + "  name: test\n", encoding="utf-8")
+        third = Config(str(config_file))
+        assert mock_load.call_count == 2
+        assert third.settings['database']['name'] == 'test'
+
+
 if __name__ == "__main__":
     current_file = os.path.abspath(__file__)
     pytest.main([current_file, '-vv'])
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared pytest fixtures for the chat service tests.
+"""
+
+from unittest.mock import MagicMock
+import pytest
+from src.lib.services.chat.message_managers.message import ChatMessage, MessageRole, TextBlock
+
+
+def _build_memory(config):
+    """
+    Return a new ChatMemory instance for the given configuration.
+    """
+    from src.lib.services.chat.memory import ChatMemory  # pylint: disable=C0415
+    return ChatMemory.create(config)
+
+
+@pytest.fixture(scope="session")
+def chroma_persist_directory(tmp_path_factory):
+    """
+    Per-session Chroma persist directory, so parallel pytest-xdist
+    workers do not share the same on-disk store
+    """
+    return str(tmp_path_factory.mktemp("chroma"))
+
+
+@pytest.fixture
+def build_memory():
+    """
+    Fixture returning the ChatMemory builder, creating a fresh memory
+    for each test so no result state is carried between tests
+    """
+    return _build_memory
+
+
+_MOCK_POST_RESPONSE = MagicMock()
+
+
+@pytest.fixture
+def mock_post_response():
+    """
+    Shared mocked HTTP response for the remote memory requests,
+    reset after each test to avoid leaking state between tests
+    """
+    yield _MOCK_POST_RESPONSE
+    _MOCK_POST_RESPONSE.reset_mock(return_value=True)
+
+
+@pytest.fixture
+def fake_post(monkeypatch, mock_post_response):  # pylint: disable=W0621
+    """
+    Replace requests.post in the remote memory with an in-process stub
+    that records each call and returns the shared mocked response
+    """
+    calls = []
+
+    def _post(url, json=None, verify=True, timeout=None):  # pylint: disable=W0621
+        calls.append((url, json, verify, timeout))
+        return mock_post_response
+
+    monkeypatch.setattr(
+        "src.lib.services.chat.memories.langchain.custom_remote.requests.post", _post)
+    return calls
+
+
+@pytest.fixture(scope="session")
+def sample_user_msg():
+    """
+    Shared user ChatMessage, to be treated as read-only
+    """
+    return ChatMessage(role=MessageRole.USER, blocks=[TextBlock(text="Hi")])
+
+
+@pytest.fixture(scope="session")
+def sample_assistant_msg():
+    """
+    Shared assistant ChatMessage, to be treated as read-only
+    """
+    return ChatMessage(role=MessageRole.ASSISTANT, blocks=[TextBlock(text="Hello")])
+
+
+@pytest.fixture
+def langchain_manager():
+    """
+    Fresh LangChainChatMessageManager for each test, since the manager
+    returns its own result object from every call
+    """
+    from src.lib.services.chat.message_managers.langchain.chat import (  # pylint: disable=C0415
+        LangChainChatMessageManager)
+    return LangChainChatMessageManager({"type": "LangChain"})
+
+
+@pytest.fixture
+def llamaindex_manager():
+    """
+    Fresh LlamaIndexChatMessageManager for each test, since the manager
+    returns its own result object from every call
+    """
+    from src.lib.services.chat.message_managers.llamaindex.chat import (  # pylint: disable=C0415
+        LlamaIndexChatMessageManager)
+    return LlamaIndexChatMessageManager({"type": "LlamaIndex"})
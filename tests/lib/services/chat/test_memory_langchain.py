@@ -94,12 +94,14 @@ from src.lib.services.chat.memories.langchain.custom_remote import (
         LangChainRemoteMemory
     ),
 ])
-def test_create(config, expected_class):
+def test_create(config, expected_class, build_memory, chroma_persist_directory):
     """
     Test the create factory method to ensure it returns instances of the correct classes
     based on the configuration provided.
     """
-    memory_instance = ChatMemory.create(config)
+    if "persist_directory" in config:
+        config = {**config, "persist_directory": chroma_persist_directory}
+    memory_instance = build_memory(config)
     assert isinstance(memory_instance, expected_class)
 
 
@@ -124,12 +126,13 @@ def langchain_buffer_memory_config():
     }
 
 
-def test_langchain_buffer_memory_initialization(langchain_buffer_memory_config):  # pylint: disable=W0621
+def test_langchain_buffer_memory_initialization(
+        langchain_buffer_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the initialization of LangChainBufferMemory to verify it sets up
     the correct memory instance with the configured settings.
     """
-    memory = ChatMemory.create(langchain_buffer_memory_config)
+    memory = build_memory(langchain_buffer_memory_config)
     assert isinstance(memory.memory, ConversationBufferMemory)
     assert memory.memory.memory_key == "chat_history"
     assert memory.memory.return_messages is True
@@ -146,11 +149,12 @@ def test_langchain_buffer_memory_clear(mock_clear, langchain_buffer_memory_confi
     mock_clear.assert_called_once()
 
 
-def test_langchain_buffer_memory_get_memory(langchain_buffer_memory_config):  # pylint: disable=W0621
+def test_langchain_buffer_memory_get_memory(
+        langchain_buffer_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the get_memory method of LangChainBufferMemory to verify it returns the memory instance.
     """
-    memory = ChatMemory.create(langchain_buffer_memory_config)
+    memory = build_memory(langchain_buffer_memory_config)
     result = memory.get_memory()
     assert result.status == "success"
     assert result.memory is not None
@@ -236,12 +240,13 @@ def langchain_buffer_window_memory_config():
     }
 
 
-def test_langchain_buffer_window_memory_initialization(langchain_buffer_window_memory_config):  # pylint: disable=W0621
+def test_langchain_buffer_window_memory_initialization(
+        langchain_buffer_window_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the initialization of LangChainBufferWindowMemory to verify it sets up
     the correct memory instance with the configured settings.
     """
-    memory = ChatMemory.create(langchain_buffer_window_memory_config)
+    memory = build_memory(langchain_buffer_window_memory_config)
     assert isinstance(memory.memory, ConversationBufferWindowMemory)
     assert memory.memory.memory_key == "chat_history"
     assert memory.memory.return_messages is True
@@ -258,11 +263,12 @@ def test_langchain_buffer_window_memory_clear(mock_clear, langchain_buffer_windo
     mock_clear.assert_called_once()
 
 
-def test_langchain_buffer_window_memory_get_memory(langchain_buffer_window_memory_config):  # pylint: disable=W0621
+def test_langchain_buffer_window_memory_get_memory(
+        langchain_buffer_window_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the get_memory method of LangChainBufferMemory to verify it returns the memory instance.
     """
-    memory = ChatMemory.create(langchain_buffer_window_memory_config)
+    memory = build_memory(langchain_buffer_window_memory_config)
     result = memory.get_memory()
     assert result.status == "success"
     assert result.memory is not None
@@ -354,12 +360,13 @@ def langchain_summary_memory_config():
     }
 
 
-def test_langchain_summary_memory_initialization(langchain_summary_memory_config):  # pylint: disable=W0621
+def test_langchain_summary_memory_initialization(
+        langchain_summary_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the initialization of LangChainSummaryMemory to verify
     it sets up the correct memory instance with the configured settings.
     """
-    memory = ChatMemory.create(langchain_summary_memory_config)
+    memory = build_memory(langchain_summary_memory_config)
     assert isinstance(memory.memory, ConversationSummaryMemory)
     assert memory.memory.memory_key == "chat_history"
     assert memory.memory.return_messages is True
@@ -376,11 +383,12 @@ def test_langchain_summary_memory_clear(mock_clear, langchain_summary_memory_con
     mock_clear.assert_called_once()
 
 
-def test_langchain_summary_memory_get_memory(langchain_summary_memory_config):  # pylint: disable=W0621
+def test_langchain_summary_memory_get_memory(
+        langchain_summary_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the get_memory method of LangChainSummaryMemory to verify it returns the memory instance.
     """
-    memory = ChatMemory.create(langchain_summary_memory_config)
+    memory = build_memory(langchain_summary_memory_config)
     result = memory.get_memory()
     assert result.status == "success"
     assert result.memory is not None
@@ -476,14 +484,14 @@ def test_langchain_summary_memory_get_summary_string():
 
 
 @pytest.fixture
-def langchain_chroma_store_memory_config():
+def langchain_chroma_store_memory_config(chroma_persist_directory):
     """
     Mockup LangChain Chroma Store memory configuration
     """
     return {
         "type": "LangChainChromaStore",
         "memory_key": "chat_history",
-        "persist_directory": "tests/lib/services/chat/data",
+        "persist_directory": chroma_persist_directory,
         "collection_name": "my_collection",
         "k": 5
     }
@@ -514,12 +522,13 @@ def test_langchain_chroma_store_memory_clear(mock_clear, langchain_chroma_store_
     mock_clear.assert_called_once()
 
 
-def test_langchain_chroma_store_memory_get_memory(langchain_chroma_store_memory_config):  # pylint: disable=W0621
+def test_langchain_chroma_store_memory_get_memory(
+        langchain_chroma_store_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the get_memory method of LangChainChromaStoreMemory
     to verify it returns the memory instance.
     """
-    memory = ChatMemory.create(langchain_chroma_store_memory_config)
+    memory = build_memory(langchain_chroma_store_memory_config)
     result = memory.get_memory()
     assert result.status == "success"
     assert result.memory is not None
@@ -625,54 +634,44 @@ def langchain_remote_memory_config():
     }
 
 
-@patch('src.lib.services.chat.memories.langchain.custom_remote.requests.post')
-def test_custom_remote_memory_load(mock_post, langchain_remote_memory_config):  # pylint: disable=W0621
+def test_custom_remote_memory_load(
+        fake_post, mock_post_response, langchain_remote_memory_config):  # pylint: disable=W0621
     """
     Test the load_memory_variables method of CustomLangChainRemoteMemory.
     """
-    mock_response = MagicMock()
-    mock_response.raise_for_status = MagicMock()
-    mock_response.json.return_value = {
+    mock_post_response.json.return_value = {
         "chat_history": '[{"type": "HumanMessage", "content": "Hi"}]'
     }
-    mock_post.return_value = mock_response
     memory = CustomLangChainRemoteMemory(langchain_remote_memory_config)
     result = memory.load_memory_variables("inputs")
     assert isinstance(result["chat_history"], list)
-    mock_post.assert_called_once_with(
-        'http://remote-memory-service/load',
-        json={'inputs': 'inputs'},
-        verify=True,
-        timeout=10
-    )
+    assert fake_post == [
+        ('http://remote-memory-service/load', {'inputs': 'inputs'}, True, 10)
+    ]
 
 
-@patch('src.lib.services.chat.memories.langchain.custom_remote.requests.post')
-def test_custom_remote_memory_save(mock_post, langchain_remote_memory_config):  # pylint: disable=W0621
+def test_custom_remote_memory_save(fake_post, langchain_remote_memory_config):  # pylint: disable=W0621
     """
     Test the save_context method of CustomLangChainRemoteMemory.
     """
-    mock_post.return_value.raise_for_status = MagicMock()
     memory = CustomLangChainRemoteMemory(langchain_remote_memory_config)
     human = HumanMessage(content="Hi")
     memory.save_context({"chat_history": [human]}, "response")
-    args, kwargs = mock_post.call_args  # pylint: disable=W0612
-    assert kwargs["json"]["outputs"] == "response"
-    assert isinstance(kwargs["json"]["inputs"]["chat_history"], str)
-    mock_post.assert_called_once()
+    assert len(fake_post) == 1
+    _, data, _, _ = fake_post[0]
+    assert data["outputs"] == "response"
+    assert isinstance(data["inputs"]["chat_history"], str)
 
 
-@patch('src.lib.services.chat.memories.langchain.custom_remote.requests.post')
-def test_custom_remote_memory_clear(mock_post, langchain_remote_memory_config):  # pylint: disable=W0621
+def test_custom_remote_memory_clear(fake_post, langchain_remote_memory_config):  # pylint: disable=W0621
     """
     Test the clear method of CustomLangChainRemoteMemory.
     """
-    mock_post.return_value.raise_for_status = MagicMock()
     memory = CustomLangChainRemoteMemory(langchain_remote_memory_config)
     memory.clear()
-    args, kwargs = mock_post.call_args
-    assert kwargs["json"] is None
-    assert "/clear" in args[0]
+    url, data, _, _ = fake_post[0]
+    assert data is None
+    assert "/clear" in url
 
 
 @patch.object(CustomLangChainRemoteMemory, 'load_memory_variables')
@@ -702,11 +701,12 @@ def test_langchain_remote_memory_clear(mock_clear, langchain_remote_memory_confi
     mock_clear.assert_called_once()
 
 
-def test_langchain_remote_memory_get_memory(langchain_remote_memory_config):  # pylint: disable=W0621
+def test_langchain_remote_memory_get_memory(
+        langchain_remote_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the get_memory method of LangChainRemoteMemory to verify it returns the memory instance.
     """
-    memory = ChatMemory.create(langchain_remote_memory_config)
+    memory = build_memory(langchain_remote_memory_config)
     result = memory.get_memory()
     assert result.status == "success"
     assert result.memory is not None
@@ -20,31 +20,18 @@ from src.lib.services.chat.memories.llamaindex.buffer import (
     LlamaIndexBufferMemory
 )
 
-@pytest.mark.parametrize("config, expected_class", [
-    (
-        {
-            "type": "LlamaIndexBuffer",
-            "memory_key": "chat_history"
-        },
-        LlamaIndexBufferMemory
-    ),
-])
-def test_create(config, expected_class):
-    """
-    Test the create factory method to ensure it returns instances of the correct classes
-    based on the configuration provided.
-    """
-    memory_instance = ChatMemory.create(config)
-    assert isinstance(memory_instance, expected_class)
-
 
-def test_create_with_invalid_type():
+def test_create(build_memory):
     """
-    Test the create factory method to ensure it raises a ValueError
-    when an unsupported type is passed.
+    Test the create factory method to ensure it returns an instance of the correct class
+    based on the configuration provided.
     """
-    with pytest.raises(ValueError):
-        ChatMemory.create({"type": "UnknownType", "memory_key": "invalid"})
+    config = {
+        "type": "LlamaIndexBuffer",
+        "memory_key": "chat_history"
+    }
+    memory_instance = build_memory(config)
+    assert isinstance(memory_instance, LlamaIndexBufferMemory)
 
 
 @pytest.fixture
@@ -58,12 +45,13 @@ def llamaindex_buffer_memory_config():
     }
 
 
-def test_llamaindex_buffer_memory_initialization(llamaindex_buffer_memory_config):  # pylint: disable=W0621
+def test_llamaindex_buffer_memory_initialization(
+        llamaindex_buffer_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the initialization of LlamaIndexBufferMemory to verify it sets up
     the correct memory instance with the configured settings.
     """
-    memory = ChatMemory.create(llamaindex_buffer_memory_config)
+    memory = build_memory(llamaindex_buffer_memory_config)
     assert isinstance(memory.memory, ChatMemoryBuffer)
     assert memory.memory.chat_store_key == "chat_history"
 
@@ -79,11 +67,12 @@ def test_lllamaindex_buffer_memory_clear(mock_clear, llamaindex_buffer_memory_co
     mock_clear.assert_called_once()
 
 
-def test_llamaindex_buffer_memory_get_memory(llamaindex_buffer_memory_config):  # pylint: disable=W0621
+def test_llamaindex_buffer_memory_get_memory(
+        llamaindex_buffer_memory_config, build_memory):  # pylint: disable=W0621
     """
     Test the get_memory method of LlamaIndexBufferMemory to verify it returns the memory instance.
     """
-    memory = ChatMemory.create(llamaindex_buffer_memory_config)
+    memory = build_memory(llamaindex_buffer_memory_config)
     result = memory.get_memory()
     assert result.status == "success"
     assert result.memory is not None
@@ -9,664 +9,311 @@ model's methods to ensure correct setup and functionality.
 """
 
 import os
-from unittest.mock import patch, MagicMock, AsyncMock
+import functools
+import importlib
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch, AsyncMock
 import pytest
-from langchain_openai import ChatOpenAI
-from langchain_openai import AzureChatOpenAI
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_anthropic import ChatAnthropic
-from langchain_mistralai import ChatMistralAI
-from langchain_nvidia_ai_endpoints import ChatNVIDIA
-from src.lib.services.chat.model import ChatModel
-from src.lib.services.chat.models.langchain.chat_openai import (
-    LangChainChatOpenAIModel)
-from src.lib.services.chat.models.langchain.azure_chat_openai import (
-    LangChainAzureChatOpenAIModel)
-from src.lib.services.chat.models.langchain.chat_google_genai import (
-    LangChainChatGoogleGenAIModel)
-from src.lib.services.chat.models.langchain.chat_anthropic import (
-    LangChainChatAnthropicModel)
-from src.lib.services.chat.models.langchain.chat_mistralai import (
-    LangChainChatMistralAIModel)
-from src.lib.services.chat.models.langchain.chat_nvidia import (
-    LangChainChatNvidiaModel)
-
-
-@pytest.mark.parametrize("config, expected_class", [
-    (
-        {
-            "type": "LangChainChatOpenAI",
-            "model_name": "gpt-3",
-            "api_key": "your_api_key"
-        },
-        LangChainChatOpenAIModel
-    ),
-    (
-        {
-            "type": "LangChainAzureChatOpenAI",
-            "api_key": "your_api_key",
-            "azure_deployment": "your_deployment",
-            "api_version": "your_version",
-            "endpoint": "api_endpoint"
-        },
-        LangChainAzureChatOpenAIModel
-    ),
-        (
-        {
-            "type": "LangChainChatGoogleGenAI",
-            "model_name": "gemini-1.5-pro",
-            "api_key": "your_api_key"
-        },
-        LangChainChatGoogleGenAIModel
-    ),
-    (
-        {
-            "type": "LangChainChatAnthropic",
-            "model_name": "claude-3-5-sonnet-20240620",
-            "api_key": "your_api_key"
-        },
-        LangChainChatAnthropicModel
-    ),
-    (
-        {
-            "type": "LangChainChatMistralAI",
-            "model_name": "mistral-large-latest",
-            "api_key": "your_api_key"
-        },
-        LangChainChatMistralAIModel
-    ),
-    (
-        {
-            "type": "LangChainChatNvidia",
-            "model_name": "meta/llama-3.1-8b-instruct",
-            "api_key": "your_api_key"
-        },
-        LangChainChatNvidiaModel
-    ),
-])
-def test_create(config, expected_class):
-    """
-    Test the create factory method to ensure it returns instances of the correct classes
-    based on the configuration provided.
-    """
-    model_instance = ChatModel.create(config)
-    assert isinstance(model_instance, expected_class)
 
 
-def test_create_with_invalid_type():
-    """
-    Test the create factory method to ensure it raises a ValueError
-    when an unsupported type is passed.
-    """
-    with pytest.raises(ValueError):
-        ChatModel.create({"type": "UnknownType", "model_name": "invalid"})
+# Dotted paths of the wrapper and SDK classes of each model type. They are
+# resolved lazily, so the wrapper tests of a provider only import its own SDK.
+# The factory tests import every SDK and skip if any of them is missing.
+_MODEL_CLASSES = {
+    "LangChainChatOpenAI": (
+        "src.lib.services.chat.models.langchain.chat_openai.LangChainChatOpenAIModel",
+        "langchain_openai.ChatOpenAI"),
+    "LangChainAzureChatOpenAI": (
+        "src.lib.services.chat.models.langchain.azure_chat_openai.LangChainAzureChatOpenAIModel",
+        "langchain_openai.AzureChatOpenAI"),
+    "LangChainChatGoogleGenAI": (
+        "src.lib.services.chat.models.langchain.chat_google_genai.LangChainChatGoogleGenAIModel",
+        "langchain_google_genai.ChatGoogleGenerativeAI"),
+    "LangChainChatAnthropic": (
+        "src.lib.services.chat.models.langchain.chat_anthropic.LangChainChatAnthropicModel",
+        "langchain_anthropic.ChatAnthropic"),
+    "LangChainChatMistralAI": (
+        "src.lib.services.chat.models.langchain.chat_mistralai.LangChainChatMistralAIModel",
+        "langchain_mistralai.ChatMistralAI"),
+    "LangChainChatNvidia": (
+        "src.lib.services.chat.models.langchain.chat_nvidia.LangChainChatNvidiaModel",
+        "langchain_nvidia_ai_endpoints.ChatNVIDIA"),
+}
 
 
-@pytest.fixture
-def langchain_chatopenai_model_config():
-    """
-    Mockup LangChain_ChatOpenAI model
+def _resolve(path, skip_missing=False):
     """
-    return {
-        "type": "LangChainChatOpenAI",
-        "model_name": "gpt-3",
-        "api_key": "your_api_key"
-    }
+    Import and return the object referenced by a dotted path.
 
-
-@patch.object(ChatOpenAI, 'invoke')
-def test_langchain_chatopenaimodel_invoke(mock_invoke, langchain_chatopenai_model_config):  # pylint: disable=W0621
+    :param path: Dotted path in the form 'package.module.Name'.
+    :param skip_missing: Skip the test instead of failing if the module is not installed.
+    :return: The referenced object.
     """
-    Test the invoke method of LangChainChatOpenAIModel to verify it returns a result
-    with the correct status, content, and metadata.
-    """
-    # Create a mock response object
-    mock_response = MagicMock()
-    mock_response.content = "Mocked response"
-    mock_response.response_metadata = {"key": "value"}
-    # Set the mock to return the mock response object
-    mock_invoke.return_value = mock_response
-    llm = LangChainChatOpenAIModel(langchain_chatopenai_model_config)
-    result = llm.invoke("Hello, world!")
-    assert result.status == "success"
-    assert result.content == "Mocked response"
-    assert result.metadata == {"key": "value"}  # Update this to match expected metadata
-    mock_invoke.assert_called_once_with("Hello, world!")
+    module_name, _, name = path.rpartition(".")
+    if skip_missing:
+        return getattr(pytest.importorskip(module_name), name)
+    return getattr(importlib.import_module(module_name), name)
 
 
-def test_langchain_chatopenaimodel_get_model(langchain_chatopenai_model_config):  # pylint: disable=W0621
+def _sdk_class(model_type):
     """
-    Test the get_model method of LangChainChatOpenAIModel to verify it returns the model instance.
+    Return the LangChain SDK class of a model type,
+    skipping the test if its provider package is not installed.
     """
-    factory = ChatModel.create(langchain_chatopenai_model_config)
-    result = factory.get_model()
-    assert result.status == "success"
-    assert result.model is not None
-    assert isinstance(result.model, ChatOpenAI)
+    return _resolve(_MODEL_CLASSES[model_type][1], skip_missing=True)
 
 
-@patch.object(ChatOpenAI, 'stream')
-def test_langchain_chatopenaimodel_stream(mock_stream, langchain_chatopenai_model_config):  # pylint: disable=W0621
+def _model_class(model_type):
     """
-    Test the get_model method of LangChainChatOpenAIModel to verify it returns the model instance.
+    Return the wrapper class of a model type.
     """
-    mock_stream.return_value = iter([MagicMock(content="chunk1"), MagicMock(content="chunk2")])
-    model = LangChainChatOpenAIModel(langchain_chatopenai_model_config)
-    chunks = list(model.stream("Hello"))
-    assert chunks == ["chunk1", "chunk2"]
+    _sdk_class(model_type)
+    return _resolve(_MODEL_CLASSES[model_type][0])
 
 
-@patch.object(ChatOpenAI, 'ainvoke', new_callable=AsyncMock)
-@pytest.mark.asyncio
-async def test_langchain_chatopenaimodel_ainvoke(mock_ainvoke, langchain_chatopenai_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method of LangChainChatOpenAIModel to verify it returns the model instance.
-    """
-    mock_response = MagicMock()
-    mock_response.content = "async response"
-    mock_response.response_metadata = {}
-    mock_ainvoke.return_value = mock_response
-    model = LangChainChatOpenAIModel(langchain_chatopenai_model_config)
-    result = await model.ainvoke("Hello")
-    assert result.status == "success"
-    assert result.content == "async response"
+# SDK modules imported by the ChatModel factory besides the ones above
+_FACTORY_SDK_MODULES = ("langchain_community.llms.vllm", "llama_index.llms.openai")
 
 
-async def mock_astream_gen(*args, **kwargs):  # pylint: disable=W0613
+def _chat_model():
     """
-    The async generator function to use as the mock
+    Return the ChatModel factory, skipping the test if any of the SDKs
+    it imports at load time is not installed.
     """
-    for part in ["a", "b"]:
-        yield MagicMock(content=part)
+    for _, sdk_path in _MODEL_CLASSES.values():
+        pytest.importorskip(sdk_path.rpartition(".")[0])
+    for module_name in _FACTORY_SDK_MODULES:
+        pytest.importorskip(module_name)
+    from src.lib.services.chat.model import ChatModel  # pylint: disable=C0415
+    return ChatModel
 
-@patch.object(ChatOpenAI, 'astream', side_effect=mock_astream_gen)
-@pytest.mark.asyncio
-async def test_langchain_chatopenaimodel_astream(mock_astream, langchain_chatopenai_model_config):  # pylint: disable=W0621, W0613
+
+def _build_model(config):
     """
-    Test the get_model method of LangChainChatOpenAIModel to verify it returns the model instance.
+    Instantiate the wrapper class selected by the configuration type.
     """
-    model = LangChainChatOpenAIModel(langchain_chatopenai_model_config)
-    chunks = [chunk async for chunk in model.astream("Hello")]
-    assert chunks == ["a", "b"]
+    return _model_class(config["type"])(config)
 
 
-@pytest.fixture
-def langchain_azurechatopenai_model_config():
-    """
-    Mockup LangChain_AzureChatOpenAI model
-    """
-    return {
+@pytest.mark.parametrize("config", [
+    pytest.param(MappingProxyType({
+        "type": "LangChainChatOpenAI",
+        "model_name": "gpt-3",
+        "api_key": "your_api_key"
+    }), id="openai"),
+    pytest.param(MappingProxyType({
         "type": "LangChainAzureChatOpenAI",
-        "model_name": "hpe-model",        
         "api_key": "your_api_key",
-        "api_version": "your_api_version",
-        "endpoint": "api_endpoint",
-        "azure_deployment": "your_deployment"
-    }
-
-
-@patch.object(AzureChatOpenAI, 'invoke')
-def test_langchain_azurechatopenai_model_invoke(
-    mock_invoke, langchain_azurechatopenai_model_config):  # pylint: disable=W0621
-    """
-    Test the invoke method of LangChainAzureChatOpenAIModel to ensure it returns a result
-    with the correct status and content.
-    """
-    # Create a mock response object
-    mock_response = MagicMock()
-    mock_response.content = "Mocked response"
-    mock_response.response_metadata = {"key": "value"}
-    # Set the mock to return the mock response object
-    mock_invoke.return_value = mock_response
-    llm = LangChainAzureChatOpenAIModel(langchain_azurechatopenai_model_config)
-    result = llm.invoke("Hello, world!")
-    assert result.status == "success"
-    assert result.content == "Mocked response"
-    assert result.metadata == {"key": "value"}  # Update this to match expected metadata
-    mock_invoke.assert_called_once_with("Hello, world!")
-
-
-@patch.object(AzureChatOpenAI, 'stream')
-def test_langchain_azurechatopenai_model_stream(
-    mock_stream, langchain_azurechatopenai_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_stream.return_value = iter([MagicMock(content="chunk1"), MagicMock(content="chunk2")])
-    model = LangChainAzureChatOpenAIModel(langchain_azurechatopenai_model_config)
-    chunks = list(model.stream("Hello"))
-    assert chunks == ["chunk1", "chunk2"]
-
-
-@patch.object(AzureChatOpenAI, 'ainvoke', new_callable=AsyncMock)
-@pytest.mark.asyncio
-async def test_langchain_azurechatopenai_model_ainvoke(
-    mock_ainvoke, langchain_azurechatopenai_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_response = MagicMock()
-    mock_response.content = "async response"
-    mock_response.response_metadata = {}
-    mock_ainvoke.return_value = mock_response
-    model = LangChainAzureChatOpenAIModel(langchain_azurechatopenai_model_config)
-    result = await model.ainvoke("Hello")
-    assert result.status == "success"
-    assert result.content == "async response"
-
-
-async def azure_mock_astream_gen(*args, **kwargs):  # pylint: disable=W0613
-    """
-    The async generator function to use as the mock
-    """
-    for part in ["a", "b"]:
-        yield MagicMock(content=part)
-
-@patch.object(AzureChatOpenAI, 'astream', side_effect=azure_mock_astream_gen)
-@pytest.mark.asyncio
-async def test_langchain_azurechatopenai_model_astream(
-    mock_astream, langchain_azurechatopenai_model_config):  # pylint: disable=W0621, W0613
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    model = LangChainAzureChatOpenAIModel(langchain_azurechatopenai_model_config)
-    chunks = [chunk async for chunk in model.astream("Hello")]
-    assert chunks == ["a", "b"]
-
-
-def test_langchain_azurechatopenai_model_get_model(langchain_azurechatopenai_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method of LangChainAzureChatOpenAIModel
-    to ensure it returns the model instance.
-    """
-    factory = ChatModel.create(langchain_azurechatopenai_model_config)
-    result = factory.get_model()
-    assert result.status == "success"
-    assert result.model is not None
-    assert isinstance(result.model, AzureChatOpenAI)
-
-
-@pytest.fixture
-def langchain_chatgooglegenai_model_config():
-    """
-    Mock configuration for LangChainChatGoogleGenAI model.
-    """
-    return {
+        "azure_deployment": "your_deployment",
+        "api_version": "your_version",
+        "endpoint": "api_endpoint"
+    }), id="azure"),
+    pytest.param(MappingProxyType({
         "type": "LangChainChatGoogleGenAI",
         "model_name": "gemini-1.5-pro",
-        "api_key": "your_api_key",
-        "temperature": 0.7,
-        "max_tokens": 1024,
-        "timeout": 30,
-        "max_retries": 2,
-    }
-
-
-@patch.object(ChatGoogleGenerativeAI, 'invoke')
-def test_langchain_chatgooglegenai_model_invoke(
-    mock_invoke, langchain_chatgooglegenai_model_config):  # pylint: disable=W0621
-    """
-    Test the invoke method of LangChainChatGoogleGenAIModel to verify it returns a result
-    with the correct status and content.
-    """
-    # Create a mock response object
-    mock_response = MagicMock()
-    mock_response.content = "Mocked response"
-    mock_response.response_metadata = {"key": "value"}
-    # Set the mock to return the mock response object
-    mock_invoke.return_value = mock_response
-    llm = LangChainChatGoogleGenAIModel(langchain_chatgooglegenai_model_config)
-    result = llm.invoke("Hello, world!")
-    assert result.status == "success"
-    assert result.content == "Mocked response"
-    # If metadata is expected, you can include assertions for it here
-    mock_invoke.assert_called_once_with("Hello, world!")
-
-
-@patch.object(ChatGoogleGenerativeAI, 'stream')
-def test_langchain_chatgooglegenai_model_stream(
-    mock_stream, langchain_chatgooglegenai_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_stream.return_value = iter([MagicMock(content="chunk1"), MagicMock(content="chunk2")])
-    model = LangChainChatGoogleGenAIModel(langchain_chatgooglegenai_model_config)
-    chunks = list(model.stream("Hello"))
-    assert chunks == ["chunk1", "chunk2"]
-
-
-@patch.object(ChatGoogleGenerativeAI, 'ainvoke', new_callable=AsyncMock)
-@pytest.mark.asyncio
-async def test_langchain_chatgooglegenai_model_ainvoke(
-    mock_ainvoke, langchain_chatgooglegenai_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_response = MagicMock()
-    mock_response.content = "async response"
-    mock_response.response_metadata = {}
-    mock_ainvoke.return_value = mock_response
-    model = LangChainChatGoogleGenAIModel(langchain_chatgooglegenai_model_config)
-    result = await model.ainvoke("Hello")
-    assert result.status == "success"
-    assert result.content == "async response"
-
-
-async def googlegenai_mock_astream_gen(*args, **kwargs):  # pylint: disable=W0613
-    """
-    The async generator function to use as the mock
-    """
-    for part in ["a", "b"]:
-        yield MagicMock(content=part)
-
-@patch.object(ChatGoogleGenerativeAI, 'astream', side_effect=googlegenai_mock_astream_gen)
-@pytest.mark.asyncio
-async def test_langchain_chatgooglegenai_model_astream(
-    mock_astream, langchain_chatgooglegenai_model_config):  # pylint: disable=W0621, W0613
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    model = LangChainChatGoogleGenAIModel(langchain_chatgooglegenai_model_config)
-    chunks = [chunk async for chunk in model.astream("Hello")]
-    assert chunks == ["a", "b"]
-
-
-def test_langchain_chatgooglegenai_model_get_model(langchain_chatgooglegenai_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method of LangChainChatGoogleGenAIModel to verify
-    it returns the model instance.
-    """
-    factory = ChatModel.create(langchain_chatgooglegenai_model_config)
-    result = factory.get_model()
-    assert result.status == "success"
-    assert result.model is not None
-    assert isinstance(result.model, ChatGoogleGenerativeAI)
-
-
-@pytest.fixture
-def langchain_chatanthropic_model_config():
-    """
-    Mock configuration for LangChainChatAnthropic model.
-    """
-    return {
+        "api_key": "your_api_key"
+    }), id="google"),
+    pytest.param(MappingProxyType({
         "type": "LangChainChatAnthropic",
         "model_name": "claude-3-5-sonnet-20240620",
-        "api_key": "your_api_key",
-        "temperature": 0.7,
-        "max_tokens": 1024,
-        "timeout": 30,
-        "max_retries": 2,
-    }
-
-
-@patch.object(ChatAnthropic, 'invoke')
-def test_langchain_chatanthropic_model_invoke(
-    mock_invoke, langchain_chatanthropic_model_config):  # pylint: disable=W0621
-    """
-    Test the invoke method of LangChainChatAnthropicModel to verify it returns a result
-    with the correct status and content.
-    """
-    # Create a mock response
-    mock_response = MagicMock()
-    mock_response.content = "Mocked response"
-    mock_response.response_metadata = {"key": "value"}
-    # Set the mock to return the mock response
-    mock_invoke.return_value = mock_response
-    llm = LangChainChatAnthropicModel(langchain_chatanthropic_model_config)
-    result = llm.invoke("Hello, world!")
-    assert result.status == "success"
-    assert result.content == "Mocked response"
-    # If metadata is expected, you can include assertions for it here
-    mock_invoke.assert_called_once_with("Hello, world!")
-
-
-@patch.object(ChatAnthropic, 'stream')
-def test_langchain_chatanthropic_model_stream(mock_stream, langchain_chatanthropic_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_stream.return_value = iter([MagicMock(content="chunk1"), MagicMock(content="chunk2")])
-    model = LangChainChatAnthropicModel(langchain_chatanthropic_model_config)
-    chunks = list(model.stream("Hello"))
-    assert chunks == ["chunk1", "chunk2"]
-
-
-@patch.object(ChatAnthropic, 'ainvoke', new_callable=AsyncMock)
-@pytest.mark.asyncio
-async def test_langchain_chatanthropic_model_ainvoke(
-    mock_ainvoke, langchain_chatanthropic_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_response = MagicMock()
-    mock_response.content = "async response"
-    mock_response.response_metadata = {}
-    mock_ainvoke.return_value = mock_response
-    model = LangChainChatAnthropicModel(langchain_chatanthropic_model_config)
-    result = await model.ainvoke("Hello")
-    assert result.status == "success"
-    assert result.content == "async response"
-
-
-async def anthropic_mock_astream_gen(*args, **kwargs):  # pylint: disable=W0613
-    """
-    The async generator function to use as the mock
-    """
-    for part in ["a", "b"]:
-        yield MagicMock(content=part)
-
-@patch.object(ChatAnthropic, 'astream', side_effect=anthropic_mock_astream_gen)
-@pytest.mark.asyncio
-async def test_langchain_chatanthropic_model_astream(
-    mock_astream, langchain_chatanthropic_model_config):  # pylint: disable=W0621, W0613
+        "api_key": "your_api_key"
+    }), id="anthropic"),
+    pytest.param(MappingProxyType({
+        "type": "LangChainChatMistralAI",
+        "model_name": "mistral-large-latest",
+        "api_key": "your_api_key"
+    }), id="mistral"),
+    pytest.param(MappingProxyType({
+        "type": "LangChainChatNvidia",
+        "model_name": "meta/llama-3.1-8b-instruct",
+        "api_key": "your_api_key"
+    }), id="nvidia"),
+])
+def test_create(config):
     """
-    Test the get_model method to verify it returns the model instance.
+    Test the create factory method to ensure it returns instances of the correct classes
+    based on the configuration provided.
     """
-    model = LangChainChatAnthropicModel(langchain_chatanthropic_model_config)
-    chunks = [chunk async for chunk in model.astream("Hello")]
-    assert chunks == ["a", "b"]
+    model_instance = _chat_model().create(dict(config))
+    assert isinstance(model_instance, _model_class(config["type"]))
 
 
-def test_langchain_chatanthropic_model_get_model(langchain_chatanthropic_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method of LangChainChatAnthropicModel to verify
-    it returns the model instance.
+def test_create_with_invalid_type():
     """
-    factory = ChatModel.create(langchain_chatanthropic_model_config)
-    result = factory.get_model()
-    assert result.status == "success"
-    assert result.model is not None
-    assert isinstance(result.model, ChatAnthropic)
-
-
-@pytest.fixture
-def langchain_chatmixtral_model_config():
+    Test the create factory method to ensure it raises a ValueError
+    when an unsupported type is passed.
     """
-    Mock configuration for LangChainChatMixtral model.
+    chat_model = _chat_model()
+    with pytest.raises(ValueError):
+        chat_model.create({"type": "UnknownType", "model_name": "invalid"})
+
+
+CHATOPENAI_CONFIG = MappingProxyType({
+    "type": "LangChainChatOpenAI",
+    "model_name": "gpt-3",
+    "api_key": "your_api_key"
+})
+
+AZURECHATOPENAI_CONFIG = MappingProxyType({
+    "type": "LangChainAzureChatOpenAI",
+    "model_name": "hpe-model",
+    "api_key": "your_api_key",
+    "api_version": "your_api_version",
+    "endpoint": "api_endpoint",
+    "azure_deployment": "your_deployment"
+})
+
+CHATGOOGLEGENAI_CONFIG = MappingProxyType({
+    "type": "LangChainChatGoogleGenAI",
+    "model_name": "gemini-1.5-pro",
+    "api_key": "your_api_key",
+    "temperature": 0.7,
+    "max_tokens": 1024,
+    "timeout": 30,
+    "max_retries": 2,
+})
+
+CHATANTHROPIC_CONFIG = MappingProxyType({
+    "type": "LangChainChatAnthropic",
+    "model_name": "claude-3-5-sonnet-20240620",
+    "api_key": "your_api_key",
+    "temperature": 0.7,
+    "max_tokens": 1024,
+    "timeout": 30,
+    "max_retries": 2,
+})
+
+CHATMISTRALAI_CONFIG = MappingProxyType({
+    "type": "LangChainChatMistralAI",
+    "model_name": "mistral-large-latest",
+    "api_key": "your_api_key",
+    "temperature": 0.7,
+    "max_retries": 2,
+})
+
+CHATNVIDIA_CONFIG = MappingProxyType({
+    "type": "LangChainChatNvidia",
+    "model_name": "meta/llama-3.1-8b-instruct",
+    "api_key": "your_api_key",
+    "temperature": 0.7,
+})
+
+MODEL_CONFIGS = (
+    CHATOPENAI_CONFIG,
+    AZURECHATOPENAI_CONFIG,
+    CHATGOOGLEGENAI_CONFIG,
+    CHATANTHROPIC_CONFIG,
+    CHATMISTRALAI_CONFIG,
+    CHATNVIDIA_CONFIG,
+)
+MODEL_CASES = [
+    pytest.param(config, id=model_id)
+    for config, model_id in zip(
+        MODEL_CONFIGS, ("openai", "azure", "google", "anthropic", "mistral", "nvidia"))
+]
+
+
+@functools.lru_cache(maxsize=128)
+def _make_mock_response(content, metadata_key=None, metadata_val=None):
+    """
+    Return a mocked LLM response, built once per distinct set of arguments.
+
+    :param content: Content of the response.
+    :param metadata_key: Optional key of the single response metadata entry.
+    :param metadata_val: Value of the response metadata entry.
+    :return: Shared response object with content and response_metadata.
+    """
+    metadata = {metadata_key: metadata_val} if metadata_key is not None else {}
+    return SimpleNamespace(content=content, response_metadata=metadata)
+
+
+@pytest.mark.parametrize("config", MODEL_CASES)
+def test_invoke(config, monkeypatch):
+    """
+    Test the invoke method of each LangChain model to verify it returns a result
+    with the correct status, content, and metadata.
     """
-    return {
-        "type": "LangChainChatMistralAI",
-        "model_name": "mistral-large-latest",
-        "api_key": "your_api_key",
-        "temperature": 0.7,
-        "max_retries": 2,
-    }
+    call_log = []
+    response = _make_mock_response("Mocked response", "key", "value")
 
+    def _invoke(messages, *args, **kwargs):  # pylint: disable=W0613
+        call_log.append(messages)
+        return response
 
-@patch.object(ChatMistralAI, 'invoke')
-def test_langchain_chatmixtral_model_invoke(
-    mock_invoke, langchain_chatmixtral_model_config):  # pylint: disable=W0621
-    """
-    Test the invoke method of LangChainChatMistralAIModel to verify it returns a result
-    with the correct status and content.
-    """
-    # Create a mock response
-    mock_response = MagicMock()
-    mock_response.content = "Mocked response"
-    mock_response.response_metadata = {"key": "value"}
-    # Set the mock to return the mock response
-    mock_invoke.return_value = mock_response
-    llm = LangChainChatMistralAIModel(langchain_chatmixtral_model_config)
+    llm = _build_model(config)
+    monkeypatch.setattr(llm, "model", SimpleNamespace(invoke=_invoke))
     result = llm.invoke("Hello, world!")
     assert result.status == "success"
     assert result.content == "Mocked response"
-    # If metadata is expected, you can include assertions for it here
-    mock_invoke.assert_called_once_with("Hello, world!")
-
-
-@patch.object(ChatMistralAI, 'stream')
-def test_langchain_chatmixtral_model_stream(mock_stream, langchain_chatmixtral_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_stream.return_value = iter([MagicMock(content="chunk1"), MagicMock(content="chunk2")])
-    model = LangChainChatMistralAIModel(langchain_chatmixtral_model_config)
-    chunks = list(model.stream("Hello"))
-    assert chunks == ["chunk1", "chunk2"]
-
-
-@patch.object(ChatMistralAI, 'ainvoke', new_callable=AsyncMock)
-@pytest.mark.asyncio
-async def test_langchain_chatmixtral_model_ainvoke(
-    mock_ainvoke, langchain_chatmixtral_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_response = MagicMock()
-    mock_response.content = "async response"
-    mock_response.response_metadata = {}
-    mock_ainvoke.return_value = mock_response
-    model = LangChainChatMistralAIModel(langchain_chatmixtral_model_config)
-    result = await model.ainvoke("Hello")
-    assert result.status == "success"
-    assert result.content == "async response"
-
+    assert result.metadata == {"key": "value"}
+    assert call_log == ["Hello, world!"]
 
-async def mistralai_mock_astream_gen(*args, **kwargs):  # pylint: disable=W0613
-    """
-    The async generator function to use as the mock
-    """
-    for part in ["a", "b"]:
-        yield MagicMock(content=part)
 
-@patch.object(ChatMistralAI, 'astream', side_effect=mistralai_mock_astream_gen)
-@pytest.mark.asyncio
-async def test_langchain_chatmixtral_model_astream(
-    mock_astream, langchain_chatmixtral_model_config):  # pylint: disable=W0621, W0613
-    """
-    Test the get_model method to verify it returns the model instance.
+@pytest.mark.parametrize("config", MODEL_CASES)
+def test_get_model(config):
     """
-    model = LangChainChatMistralAIModel(langchain_chatmixtral_model_config)
-    chunks = [chunk async for chunk in model.astream("Hello")]
-    assert chunks == ["a", "b"]
-
-
-def test_langchain_chatmixtral_model_get_model(langchain_chatmixtral_model_config):  # pylint: disable=W0621
+    Test the get_model method of each LangChain model to verify
+    it returns the SDK model instance.
     """
-    Test the get_model method of LangChainChatMistralAIModel to verify
-    it returns the model instance.
-    """
-    factory = ChatModel.create(langchain_chatmixtral_model_config)
-    result = factory.get_model()
+    result = _build_model(config).get_model()
     assert result.status == "success"
-    assert result.model is not None
-    assert isinstance(result.model, ChatMistralAI)
+    assert isinstance(result.model, _sdk_class(config["type"]))
 
 
-@pytest.fixture
-def langchain_chatnvidia_model_config():
+def _astream_factory(parts=("a", "b")):
     """
-    Mock configuration for LangChainChatNvidia model.
+    Return an async generator function yielding a chunk for each part,
+    to use as the astream mock.
     """
-    return {
-        "type": "LangChainChatNvidia",
-        "model_name": "meta/llama-3.1-8b-instruct",
-        "api_key": "your_api_key",
-        "temperature": 0.7,
-    }
+    async def _astream_gen(*args, **kwargs):  # pylint: disable=W0613
+        for part in parts:
+            yield SimpleNamespace(content=part)
+    return _astream_gen
 
 
-@patch.object(ChatNVIDIA, 'invoke')
-def test_langchain_chatnvidia_model_invoke(
-    mock_invoke, langchain_chatnvidia_model_config):  # pylint: disable=W0621
+@pytest.mark.parametrize("config", MODEL_CASES)
+def test_stream(config):
     """
-    Test the invoke method of LangChainChatNvidiaModel to verify it returns a result
-    with the correct status and content.
+    Test the stream method of each LangChain model to verify it yields
+    the content of every chunk.
     """
-    # Create a mock response
-    mock_response = MagicMock()
-    mock_response.content = "Mocked response"
-    mock_response.response_metadata = {"key": "value"}
-    # Set the mock to return the mock response
-    mock_invoke.return_value = mock_response
-    # Initialize the model using the config
-    model = LangChainChatNvidiaModel(langchain_chatnvidia_model_config)
-    result = model.invoke("Hello, world!")
-    # Check that the result status and content are correct
-    assert result.status == "success"
-    assert result.content == "Mocked response"
-    # Check that the model was called with the correct input
-    mock_invoke.assert_called_once_with("Hello, world!")
-
-
-@patch.object(ChatNVIDIA, 'stream')
-def test_langchain_chatnvidia_model_stream(mock_stream, langchain_chatnvidia_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method to verify it returns the model instance.
-    """
-    mock_stream.return_value = iter([MagicMock(content="chunk1"), MagicMock(content="chunk2")])
-    model = LangChainChatNvidiaModel(langchain_chatnvidia_model_config)
-    chunks = list(model.stream("Hello"))
+    model = _build_model(config)
+    with patch.object(model, 'model') as mock_sdk:
+        mock_sdk.stream.return_value = iter(
+            [SimpleNamespace(content="chunk1"), SimpleNamespace(content="chunk2")])
+        chunks = list(model.stream("Hello"))
     assert chunks == ["chunk1", "chunk2"]
 
 
-@patch.object(ChatNVIDIA, 'ainvoke', new_callable=AsyncMock)
 @pytest.mark.asyncio
-async def test_langchain_chatnvidia_model_ainvoke(mock_ainvoke, langchain_chatnvidia_model_config):  # pylint: disable=W0621
+@pytest.mark.parametrize("config", MODEL_CASES)
+async def test_ainvoke(config):
     """
-    Test the get_model method to verify it returns the model instance.
+    Test the ainvoke method of each LangChain model to verify it returns
+    a successful result with the response content.
     """
-    mock_response = MagicMock()
-    mock_response.content = "async response"
-    mock_response.response_metadata = {}
-    mock_ainvoke.return_value = mock_response
-    model = LangChainChatNvidiaModel(langchain_chatnvidia_model_config)
-    result = await model.ainvoke("Hello")
+    model = _build_model(config)
+    with patch.object(model, 'model') as mock_sdk:
+        mock_sdk.ainvoke = AsyncMock(return_value=_make_mock_response("async response"))
+        result = await model.ainvoke("Hello")
     assert result.status == "success"
     assert result.content == "async response"
 
 
-async def nvidia_mock_astream_gen(*args, **kwargs):  # pylint: disable=W0613
-    """
-    The async generator function to use as the mock
-    """
-    for part in ["a", "b"]:
-        yield MagicMock(content=part)
-
-@patch.object(ChatNVIDIA, 'astream', side_effect=nvidia_mock_astream_gen)
 @pytest.mark.asyncio
-async def test_langchain_chatnvidia_model_astream(mock_astream, langchain_chatnvidia_model_config):  # pylint: disable=W0621, W0613
+@pytest.mark.parametrize("config", MODEL_CASES)
+async def test_astream(config):
     """
-    Test the get_model method to verify it returns the model instance.
+    Test the astream method of each LangChain model to verify it yields
+    the content of every chunk.
     """
-    model = LangChainChatNvidiaModel(langchain_chatnvidia_model_config)
-    chunks = [chunk async for chunk in model.astream("Hello")]
+    model = _build_model(config)
+    with patch.object(model, 'model') as mock_sdk:
+        mock_sdk.astream.side_effect = _astream_factory()
+        chunks = [chunk async for chunk in model.astream("Hello")]
     assert chunks == ["a", "b"]
 
 
-def test_langchain_chatnvidia_model_get_model(langchain_chatnvidia_model_config):  # pylint: disable=W0621
-    """
-    Test the get_model method of LangChainChatNvidiaModel to verify
-    it returns the model instance.
-    """
-    model = ChatModel.create(langchain_chatnvidia_model_config)
-    result = model.get_model()
-    # Check that the result status is success and the model is returned
-    assert result.status == "success"
-    assert result.model is not None
-    assert isinstance(result.model, ChatNVIDIA)
-
-
 if __name__ == "__main__":
     current_file = os.path.abspath(__file__)
     pytest.main([current_file, '-vv'])
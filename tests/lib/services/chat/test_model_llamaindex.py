@@ -9,34 +9,52 @@ model's methods to ensure correct setup and functionality.
 """
 
 import os
-from unittest.mock import patch, MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
 import pytest
-from llama_index.llms.openai import OpenAI
 from llama_index.core.llms import ChatMessage, MessageRole
-from src.lib.services.chat.model import ChatModel
-from src.lib.services.chat.models.llamaindex.openai import (
-    LlamaIndexOpenAIModel
-)
-
-
-@pytest.mark.parametrize("config, expected_class", [
-    (
-        {
-            "type": "LlamaIndexOpenAI",
-            "model_name": "gpt-3",
-            "api_key": "your_api_key",
-            "system_prompt": "your_prompt"
-        },
-        LlamaIndexOpenAIModel
-    ),
+
+
+# Keep the tests on one xdist worker so they share the module-scoped fixtures
+pytestmark = pytest.mark.xdist_group("llamaindex_models")
+
+
+# Dotted paths of the patched LlamaIndex OpenAI client and methods
+_OPENAI = "llama_index.llms.openai.OpenAI"
+_OPENAI_CHAT = f"{_OPENAI}.chat"
+_OPENAI_STREAM_CHAT = f"{_OPENAI}.stream_chat"
+_OPENAI_ACHAT = f"{_OPENAI}.achat"
+_OPENAI_ASTREAM_CHAT = f"{_OPENAI}.astream_chat"
+
+
+def _model_class():
+    """
+    Import the LlamaIndex OpenAI wrapper on first use, skipping the test
+    if the LlamaIndex OpenAI integration is not installed.
+    """
+    pytest.importorskip("llama_index.llms.openai")
+    from src.lib.services.chat.models.llamaindex.openai import (  # pylint: disable=C0415
+        LlamaIndexOpenAIModel)
+    return LlamaIndexOpenAIModel
+
+
+@pytest.mark.parametrize("config", [
+    {
+        "type": "LlamaIndexOpenAI",
+        "model_name": "gpt-3",
+        "api_key": "your_api_key",
+        "system_prompt": "your_prompt"
+    },
 ])
-def test_create(config, expected_class):
+def test_create(config):
     """
     Test the create factory method to ensure it returns instances of the correct classes
     based on the configuration provided.
     """
+    model_class = _model_class()
+    from src.lib.services.chat.model import ChatModel  # pylint: disable=C0415
     model_instance = ChatModel.create(config)
-    assert isinstance(model_instance, expected_class)
+    assert isinstance(model_instance, model_class)
 
 
 def test_create_with_invalid_type():
@@ -44,11 +62,12 @@ def test_create_with_invalid_type():
     Test the create factory method to ensure it raises a ValueError
     when an unsupported type is passed.
     """
+    from src.lib.services.chat.model import ChatModel  # pylint: disable=C0415
     with pytest.raises(ValueError):
         ChatModel.create({"type": "UnknownType", "model_name": "invalid"})
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def llamaindex_openai_model_config():
     """
     Mockup LLamaIndex_OpenAI model
@@ -60,36 +79,38 @@ def llamaindex_openai_model_config():
     }
 
 
-@patch.object(OpenAI, 'chat')
-@pytest.mark.parametrize("input_data,expected_content", [
-    (
-        "Hello",
-        "Mocked response for string"
-    ),
-    (
-        ChatMessage(role=MessageRole.USER, content="Hi"),
-        "Mocked response for single ChatMessage"
-    ),
-    (
-        ["Hey", "What's up?"],
-        "Mocked response for list of strings"
-    ),
-    (
-        [ChatMessage(role=MessageRole.USER, content="Hi again")],
-        "Mocked response for list of ChatMessages"
-    ),
+@pytest.fixture(scope="module")
+def llm(llamaindex_openai_model_config):  # pylint: disable=W0621
+    """
+    LlamaIndexOpenAIModel shared by the tests of this module
+    """
+    return _model_class()(llamaindex_openai_model_config)
+
+
+@patch(_OPENAI_CHAT)
+@pytest.mark.parametrize("build_input,expected_content", [
+    pytest.param(
+        lambda: "Hello",
+        "Mocked response for string", id="str"),
+    pytest.param(
+        lambda: ChatMessage(role=MessageRole.USER, content="Hi"),
+        "Mocked response for single ChatMessage", id="single_msg"),
+    pytest.param(
+        lambda: ["Hey", "What's up?"],
+        "Mocked response for list of strings", id="list_str"),
+    pytest.param(
+        lambda: [ChatMessage(role=MessageRole.USER, content="Hi again")],
+        "Mocked response for list of ChatMessages", id="list_msg"),
 ])
 def test_llamaindex_openaimodel_invoke_variants(
-    mock_chat, llamaindex_openai_model_config, input_data, expected_content):  # pylint: disable=W0621
+    mock_chat, llm, build_input, expected_content):  # pylint: disable=W0621
     """
     Test the invoke method of LlamaIndexOpenAIModel to verify it returns a result
     with the correct status, content, and metadata.
     """
-    mock_response = MagicMock()
-    mock_response.text = expected_content
-    mock_response.additional_kwargs = {"source": "unit_test"}
-    mock_chat.return_value = mock_response
-    llm = LlamaIndexOpenAIModel(llamaindex_openai_model_config)
+    input_data = build_input()
+    mock_chat.return_value = SimpleNamespace(
+        text=expected_content, additional_kwargs={"source": "unit_test"})
     result = llm.invoke(input_data)
     assert result.status == "success"
     assert result.content == expected_content
@@ -97,31 +118,36 @@ def test_llamaindex_openaimodel_invoke_variants(
     mock_chat.assert_called_once()
 
 
-@patch.object(OpenAI, 'stream_chat')
-def test_llamaindex_openaimodel_stream(mock_stream_chat, llamaindex_openai_model_config):  # pylint: disable=W0621
+_MOCK_CHUNK = SimpleNamespace(delta="token")
+
+
+async def _async_chunks(*args, **kwargs):  # pylint: disable=W0613
+    """
+    The async generator returned by the mocked astream_chat
+    """
+    yield _MOCK_CHUNK
+    yield _MOCK_CHUNK
+
+
+@patch(_OPENAI_STREAM_CHAT)
+def test_llamaindex_openaimodel_stream(mock_stream_chat, llm):  # pylint: disable=W0621
     """
     Test the stream method of LlamaIndexOpenAIModel to ensure it yields tokens.
     """
-    mock_chunk = MagicMock()
-    mock_chunk.delta = "token"
-    mock_stream_chat.return_value = iter([mock_chunk, mock_chunk])
-    llm = LlamaIndexOpenAIModel(llamaindex_openai_model_config)
-    tokens = list(llm.stream("hello"))
+    mock_stream_chat.return_value = iter((_MOCK_CHUNK,) * 2)
+    tokens = list(llm.stream("Hi"))
     assert tokens == ["token", "token"]
     mock_stream_chat.assert_called_once()
 
 
-@patch.object(OpenAI, 'achat', new_callable=AsyncMock)
+@patch(_OPENAI_ACHAT, new_callable=AsyncMock)
 @pytest.mark.asyncio
-async def test_llamaindex_openaimodel_ainvoke(mock_achat, llamaindex_openai_model_config):  # pylint: disable=W0621
+async def test_llamaindex_openaimodel_ainvoke(mock_achat, llm):  # pylint: disable=W0621
     """
     Test the ainvoke method of LlamaIndexOpenAIModel to verify it works with async call.
     """
-    mock_response = MagicMock()
-    mock_response.text = "Async response"
-    mock_response.additional_kwargs = {"mode": "async"}
-    mock_achat.return_value = mock_response
-    llm = LlamaIndexOpenAIModel(llamaindex_openai_model_config)
+    mock_achat.return_value = SimpleNamespace(
+        text="Async response", additional_kwargs={"mode": "async"})
     result = await llm.ainvoke("Hi async")
     assert result.status == "success"
     assert result.content == "Async response"
@@ -129,36 +155,27 @@ async def test_llamaindex_openaimodel_ainvoke(mock_achat, llamaindex_openai_mode
     mock_achat.assert_awaited_once()
 
 
-@patch.object(OpenAI, 'astream_chat')
+@patch(_OPENAI_ASTREAM_CHAT, new_callable=AsyncMock)
 @pytest.mark.asyncio
-async def test_llamaindex_openaimodel_astream(mock_astream_chat, llamaindex_openai_model_config):  # pylint: disable=W0621
+async def test_llamaindex_openaimodel_astream(mock_astream_chat, llm):  # pylint: disable=W0621
     """
     Test the astream method of LlamaIndexOpenAIModel to ensure it yields async tokens.
     """
-    mock_chunk = MagicMock()
-    mock_chunk.delta = "async_token"
-    # ✅ Define async generator and return its result
-    async def async_gen():
-        yield mock_chunk
-        yield mock_chunk
-    mock_astream_chat.return_value = async_gen()  # <== IMPORTANT!
-    model = LlamaIndexOpenAIModel(llamaindex_openai_model_config)
-    result = []
-    async for token in model.astream("Hi"):
-        result.append(token)
-    assert result == ["async_token", "async_token"]
-    mock_astream_chat.assert_called_once()
+    mock_astream_chat.side_effect = _async_chunks
+    tokens = [token async for token in llm.astream("Hi")]
+    assert tokens == ["token", "token"]
+    mock_astream_chat.assert_awaited_once()
 
 
-def test_llamaindex_openaimodel_get_model(llamaindex_openai_model_config):  # pylint: disable=W0621
+def test_llamaindex_openaimodel_get_model(llm):  # pylint: disable=W0621
     """
     Test the get_model method of LlamaIndexOpenAIModel to verify it returns the model instance.
     """
-    factory = ChatModel.create(llamaindex_openai_model_config)
-    result = factory.get_model()
+    openai_class = pytest.importorskip("llama_index.llms.openai").OpenAI
+    result = llm.get_model()
     assert result.status == "success"
     assert result.model is not None
-    assert isinstance(result.model, OpenAI)
+    assert isinstance(result.model, openai_class)
 
 
 if __name__ == "__main__":
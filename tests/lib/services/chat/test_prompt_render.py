@@ -8,11 +8,19 @@ to be used by LLM from template files and parameters.
 """
 
 import os
+import re
 import pytest
+from jinja2 import DictLoader, Environment
 from src.lib.services.chat.prompt_render import PromptRender
 from src.lib.services.chat.prompt_renders.jinja.template import JinjaTemplatePromptRender
 
 
+# Keep the tests on one xdist worker so they reuse the cached Jinja environments
+pytestmark = pytest.mark.xdist_group("prompt_render")
+
+_INVALID_TYPE_RE = re.compile(r"Unsupported prompt file render type: UnsupportedType")
+
+
 @pytest.fixture
 def jinja_template_config():
     """
@@ -42,7 +50,7 @@ def test_prompt_render_create_invalid_type():
     config = {
         "type": "UnsupportedType"
     }
-    with pytest.raises(ValueError, match="Unsupported prompt file render type: UnsupportedType"):
+    with pytest.raises(ValueError, match=_INVALID_TYPE_RE):
         PromptRender.create(config)
 
 
@@ -76,21 +84,79 @@ def test_render_template_string_failure(jinja_template_prompt_render):  # pylint
     assert result.error_message is not None
 
 
-def test_load_template_file_success(jinja_template_prompt_render, tmp_path):  # pylint: disable=W0621
+@pytest.fixture
+def in_memory_templates(monkeypatch):
+    """
+    Serve the templates of JinjaTemplatePromptRender from memory instead of the filesystem
+    """
+    environment = Environment(
+        loader=DictLoader({"greeting_template.txt": "Hello, {{ name }}!"}))
+    monkeypatch.setattr(
+        JinjaTemplatePromptRender, "_get_environment",
+        classmethod(lambda cls, env_path: environment))
+
+
+def test_load_template_file_success(
+        jinja_template_prompt_render, in_memory_templates):  # pylint: disable=W0621, W0613
     """
     Test the load method for successful prompt generation from a template file
     """
-    env_path = tmp_path / "path/to/config"
-    env_path.mkdir(parents=True)
-    template_file = env_path / "greeting_template.txt"
-    template_file.write_text("Hello, {{ name }}!", encoding="utf-8")
     params = {"name": "John"}
-    jinja_template_prompt_render.config.environment = str(env_path)
     result = jinja_template_prompt_render.load("greeting", **params)
     assert result.status == "success"
     assert result.content == "Hello, John!"
 
 
+@pytest.fixture
+def template_folder(jinja_template_prompt_render, tmp_path, monkeypatch):  # pylint: disable=W0621
+    """
+    Template folder on disk with a greeting template, served through
+    an empty Jinja environment cache
+    """
+    monkeypatch.setattr(JinjaTemplatePromptRender, "_environments", {})
+    (tmp_path / "greeting_template.txt").write_text("Hello, {{ name }}!", encoding="utf-8")
+    jinja_template_prompt_render.config.environment = str(tmp_path)
+    return tmp_path
+
+
+def test_load_template_file_from_disk(
+        jinja_template_prompt_render, template_folder):  # pylint: disable=W0621, W0613
+    """
+    Test the load method reading the template file through the filesystem loader
+    """
+    result = jinja_template_prompt_render.load("greeting", name="John")
+    assert result.status == "success"
+    assert result.content == "Hello, John!"
+
+
+def test_load_shares_environment(  # pylint: disable=W0621
+        jinja_template_prompt_render,
+        jinja_template_config,
+        template_folder):
+    """
+    Test that renderers loading from the same folder share one Jinja environment
+    """
+    environments = JinjaTemplatePromptRender._environments  # pylint: disable=W0212
+    other_render = JinjaTemplatePromptRender(
+        {**jinja_template_config, "environment": str(template_folder)})
+    assert jinja_template_prompt_render.load("greeting", name="John").status == "success"
+    environment = environments[str(template_folder)]
+    assert other_render.load("greeting", name="Jane").content == "Hello, Jane!"
+    assert environments == {str(template_folder): environment}
+
+
+def test_load_after_save_returns_new_content(
+        jinja_template_prompt_render, template_folder):  # pylint: disable=W0621, W0613
+    """
+    Test that a template rewritten by save is reloaded by the next load
+    """
+    assert jinja_template_prompt_render.load("greeting", name="John").content == "Hello, John!"
+    assert jinja_template_prompt_render.save("greeting", "Bye, {{ name }}!").status == "success"
+    result = jinja_template_prompt_render.load("greeting", name="John")
+    assert result.status == "success"
+    assert result.content == "Bye, John!"
+
+
 def test_load_template_file_failure(jinja_template_prompt_render):  # pylint: disable=W0621
     """
     Test the load method for failure scenario
@@ -49,7 +49,7 @@ def test_invalid_config():
     for config in invalid_configs:
         with pytest.raises(ValueError) as excinfo:
             AthonTool(config, logger)
-        print(excinfo.value) # Can be seen passing "-s" flag to pytest
+        logger.debug("Rejected config: %s", excinfo.value) # Visible with --log-cli-level=DEBUG
 
 
 def test_decorator_functionality():